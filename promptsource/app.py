@@ -356,7 +356,8 @@ else:
                 else:
                     st.text(None)
                 st.markdown("##### Jinja template")
-                splitted_template = template.jinja.split("|||")
+                # Only the input and target parts are shown, so stop splitting after them
+                splitted_template = template.jinja.split("|||", 2)
                 st.markdown("###### Input template")
                 show_jinja(splitted_template[0].strip())
                 if len(splitted_template) > 1:
@@ -1,3 +1,4 @@
+import concurrent.futures
 import csv
 import functools
 from typing import Dict, List, Optional, Tuple
@@ -35,20 +36,31 @@ GET_METRICS = {
 
 MAX_EXAMPLES_PER_DATASET = 500_000
 
+# Mixing rate shared by every mixture that is not capped per task
+_DEFAULT_RATE = functools.partial(seqio.mixing_rate_num_examples, maximum=500_000)
+
+# Output features are identical for every task, so they are built once and shared
+OUTPUT_FEATURES = {
+    "inputs": seqio.Feature(t5.data.get_default_vocabulary(), add_eos=False, dtype=tf.int32),
+    "targets": seqio.Feature(t5.data.get_default_vocabulary(), add_eos=True, dtype=tf.int32),
+}
+
 
 def strip_whitespace(output_or_target, example=None, is_target=False):
     """Cached tasks from promptsource all have a leading space on the ground-truth targets."""
     return output_or_target.strip()
 
 
-def maybe_get_class_id_postprocessor(template):
-    if template.get_fixed_answer_choices_list():
+def maybe_get_class_id_postprocessor(fixed_choices):
+    if fixed_choices:
+        # Same result as t5.data.postprocessors.string_label_to_class_id, with a dict lookup instead of list.index
+        label_to_id = {}
+        for class_id, label in enumerate(fixed_choices):
+            label_to_id.setdefault(label, class_id)
 
         def postprocess_fn(output_or_target, example=None, is_target=False):
             output_or_target = strip_whitespace(output_or_target)
-            return t5.data.postprocessors.string_label_to_class_id(
-                output_or_target, label_classes=template.get_fixed_answer_choices_list()
-            )
+            return label_to_id.get(output_or_target, -1)
 
         return postprocess_fn
 
@@ -56,18 +68,47 @@ def maybe_get_class_id_postprocessor(template):
         return strip_whitespace
 
 
+@functools.lru_cache(maxsize=4)
+def load_hf_dataset(dataset_name, subset_name):
+    # The templates and splits of a dataset are usually read back to back and share the same DatasetDict.
+    # Only the few most recent are kept, since each one holds open Arrow files.
+    return datasets.load_dataset(dataset_name, subset_name)
+
+
+@functools.lru_cache(maxsize=16)
+def load_templated_split(dataset_name, subset_name, template, split):
+    # A task and its _score_eval twin share the same data source, so the templated split is only built once.
+    # Only recent splits are kept, since each one holds open Arrow and map/filter cache files.
+    dataset = load_hf_dataset(dataset_name, subset_name)[split]
+    return utils.apply_template(dataset, template)
+
+
 def get_tf_dataset(split, shuffle_files, seed, dataset_name, subset_name, template, split_mapping):
     # HF datasets does not support file-level shuffling
     del shuffle_files, seed
-    dataset = datasets.load_dataset(dataset_name, subset_name)
-    dataset = dataset[split_mapping[split]]
-    dataset = utils.apply_template(dataset, template)
-    return utils.hf_dataset_to_tf_dataset(dataset)
-
-
-def add_task(dataset_name, subset_name, template_name, task_name=None, split_mapping=None):
-    template = all_templates.get_dataset(dataset_name, subset_name)[template_name]
+    dataset = load_templated_split(dataset_name, subset_name, template, split_mapping[split])
+    # Overlap reading from the HF dataset with the preprocessing and training steps downstream
+    return utils.hf_dataset_to_tf_dataset(dataset).prefetch(tf.data.experimental.AUTOTUNE)
+
+
+def get_num_input_examples(dataset_splits, split_mapping):
+    return {s: dataset_splits[split_mapping[s]].num_examples for s in split_mapping.keys()}
+
+
+def add_task(
+    dataset_name,
+    subset_name,
+    template_name,
+    task_name=None,
+    split_mapping=None,
+    dataset_splits=None,
+    num_input_examples=None,
+    template=None,
+):
+    template = template or all_templates.get_dataset(dataset_name, subset_name)[template_name]
     task_name = task_name or utils.get_task_name(dataset_name, subset_name, template_name)
+    # Rendered once here and shared by the class-id postprocessor and the rank classification task
+    fixed_choices = template.get_fixed_answer_choices_list()
 
     if dataset_name == "glue":
         metrics = get_glue_metric(subset_name)
@@ -81,8 +122,12 @@ def add_task(dataset_name, subset_name, template_name, task_name=None, split_map
         # TODO what if metric is null?
         metrics = [GET_METRICS[m] for m in template.metadata.metrics]
 
-    dataset_splits = utils.get_dataset_splits(dataset_name, subset_name)
-    split_mapping = split_mapping or {k: k for k in dataset_splits.keys()}
+    # Split metadata only depends on the dataset, so callers registering many templates can pass it in
+    if num_input_examples is None:
+        dataset_splits = dataset_splits or utils.get_dataset_splits(dataset_name, subset_name)
+        split_mapping = split_mapping or {k: k for k in dataset_splits.keys()}
+        num_input_examples = get_num_input_examples(dataset_splits, split_mapping)
+    split_mapping = split_mapping or {k: k for k in num_input_examples.keys()}
 
     dataset_fn = functools.partial(
         get_tf_dataset,
@@ -95,12 +140,8 @@ def add_task(dataset_name, subset_name, template_name, task_name=None, split_map
     data_source = seqio.FunctionDataSource(
         dataset_fn,
         splits=list(split_mapping.keys()),
-        num_input_examples={s: dataset_splits[split_mapping[s]].num_examples for s in split_mapping.keys()},
+        num_input_examples=num_input_examples,
     )
-    output_features = {
-        "inputs": seqio.Feature(t5.data.get_default_vocabulary(), add_eos=False, dtype=tf.int32),
-        "targets": seqio.Feature(t5.data.get_default_vocabulary(), add_eos=True, dtype=tf.int32),
-    }
     preprocessors = [
         seqio.preprocessors.tokenize,
         seqio.preprocessors.append_eos,
@@ -112,32 +153,47 @@ def add_task(dataset_name, subset_name, template_name, task_name=None, split_map
         task_name,
         data_source,
         preprocessors=preprocessors,
-        output_features=output_features,
+        output_features=OUTPUT_FEATURES,
         metric_fns=metrics,
-        postprocess_fn=maybe_get_class_id_postprocessor(template),
+        postprocess_fn=maybe_get_class_id_postprocessor(fixed_choices),
     )
 
     # Add rank classification eval task
     if template.answer_choices:
-        rank_classification_preprocessor = functools.partial(
-            t5.data.preprocessors.rank_classification,
-            inputs_fn=lambda ex: tf.fill((len(ex["answer_choices"]),), ex["inputs"]),
-            targets_fn=lambda ex: ex["answer_choices"],
-            is_correct_fn=lambda ex: tf.equal(ex["answer_choices"], tf.strings.strip(ex["targets"])),
-            weight_fn=lambda ex: 1.0,
-        )
+        if fixed_choices:
+            # Static choices are embedded in the graph as a constant of known length,
+            # instead of being read back from every example
+            num_choices = len(fixed_choices)
+            rank_classification_preprocessor = functools.partial(
+                t5.data.preprocessors.rank_classification,
+                inputs_fn=lambda ex: tf.fill((num_choices,), ex["inputs"]),
+                targets_fn=lambda ex: tf.constant(fixed_choices, dtype=tf.string),
+                is_correct_fn=lambda ex: tf.equal(
+                    tf.constant(fixed_choices, dtype=tf.string), tf.strings.strip(ex["targets"])
+                ),
+                weight_fn=lambda ex: 1.0,
+            )
+        else:
+            rank_classification_preprocessor = functools.partial(
+                t5.data.preprocessors.rank_classification,
+                inputs_fn=lambda ex: tf.fill((len(ex["answer_choices"]),), ex["inputs"]),
+                targets_fn=lambda ex: ex["answer_choices"],
+                is_correct_fn=lambda ex: tf.equal(ex["answer_choices"], tf.strings.strip(ex["targets"])),
+                weight_fn=lambda ex: 1.0,
+            )
 
-        fixed_choices = template.get_fixed_answer_choices_list()
         num_classes = len(fixed_choices) if fixed_choices else None
         seqio.TaskRegistry.add(
             task_name + "_score_eval",
             data_source,
             preprocessors=[rank_classification_preprocessor] + preprocessors,
-            output_features=output_features,
+            output_features=OUTPUT_FEATURES,
             metric_fns=[functools.partial(t5.evaluation.metrics.rank_classification, num_classes=num_classes)],
             postprocess_fn=t5.data.postprocessors.rank_classification,
         )
 
+    return task_name
+
 
 datatset_subset_tuple = Tuple[str, Optional[str]]
 d4_train: List[datatset_subset_tuple] = []
@@ -148,29 +204,49 @@ bias_fairness_eval: List[datatset_subset_tuple] = []
 gsheet: Dict[datatset_subset_tuple, Dict] = {}
 experiment_path = pkg_resources.resource_filename(__name__, "experiment_D4.csv")
 with open(experiment_path) as exp_file:
-    reader = csv.DictReader(exp_file)
+    reader = csv.reader(exp_file)
+    header = next(reader)
+    # The spreadsheet has a fixed schema, so columns are read by position instead of building a dict per row
+    skip_col, hf_name_col, subset_col, do_train_col, do_eval_col, d3_do_train_col, seed_paper_col, task_col = (
+        header.index(column)
+        for column in (
+            "skip",
+            "HF_name",
+            "subset",
+            "do_train",
+            "do_eval",
+            "D3_do_train",
+            "seed_paper",
+            "task_by_convention",
+        )
+    )
     for row in reader:
-        if row["skip"]:
+        if not row or row[skip_col]:
             continue
-        if row["subset"] == "":
-            row["subset"] = None  # to match promptsource.Template object
-        dataset_subset = (row["HF_name"], row["subset"])
-        if row["do_train"] == "TRUE":
+        hf_name = row[hf_name_col]
+        subset = row[subset_col] or None  # to match promptsource.Template object
+        dataset_subset = (hf_name, subset)
+        do_train = row[do_train_col] == "TRUE"
+        do_eval = row[do_eval_col] == "TRUE"
+        d3_do_train = row[d3_do_train_col] == "TRUE"
+        if do_train:
             d4_train.append(dataset_subset)
-        if row["do_eval"] == "TRUE":
+        if do_eval:
             d4_eval.append(dataset_subset)
-        if row["D3_do_train"] == "TRUE" and "GPT" in row["seed_paper"]:
+        if d3_do_train and "GPT" in row[seed_paper_col]:
             d3_train_gpt.append(dataset_subset)
-        if row["D3_do_train"] == "TRUE" and row["HF_name"] == "super_glue":
+        if d3_do_train and hf_name == "super_glue":
             d3_train_sglue.append(dataset_subset)
-        if (
-            row["do_eval"] == "TRUE"
-            and row["task_by_convention"] == "bias_and_fairness"
-            and row["HF_name"] != "winogender"
-        ):
+        if do_eval and row[task_col] == "bias_and_fairness" and hf_name != "winogender":
             bias_fairness_eval.append(dataset_subset)
-        gsheet[dataset_subset] = row
-all_datasets = d4_train + d4_eval + d3_train_gpt + d3_train_sglue + bias_fairness_eval
+        gsheet[dataset_subset] = {**dict(zip(header, row)), "subset": subset}
+# Sets for constant-time membership checks, the lists above keep the order of the spreadsheet
+d4_train_set = set(d4_train)
+d4_eval_set = set(d4_eval)
+d3_train_gpt_set = set(d3_train_gpt)
+d3_train_sglue_set = set(d3_train_sglue)
+bias_fairness_eval_set = set(bias_fairness_eval)
+all_datasets = d4_train_set | d4_eval_set | d3_train_gpt_set | d3_train_sglue_set | bias_fairness_eval_set
 
 all_templates = promptsource.templates.TemplateCollection()
 all_templates.remove("anli")  # Need to special-case ANLI due to weird split conventions
@@ -187,10 +263,24 @@ all_original_tasks: List[str] = []
 for dataset_name, subset_name in all_templates.keys:
     if (dataset_name, subset_name) not in all_datasets:
         all_templates.remove(dataset_name, subset_name)
-        continue
 
+# Dataset infos come from the HF hub, so they are fetched concurrently up front (ANLI included).
+# Each dataset script is fetched once, whatever its number of subsets, since loading the same script from
+# several threads at once is not known to be safe. Task registration below stays sequential since the
+# seqio registries are not thread-safe.
+dataset_subsets = all_templates.keys + [("anli", None)]
+dataset_names = sorted({dataset_name for dataset_name, _ in dataset_subsets})
+with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+    all_dataset_infos = dict(zip(dataset_names, executor.map(datasets.get_dataset_infos, dataset_names)))
+all_dataset_splits = {
+    (dataset_name, subset_name): utils.get_dataset_splits(dataset_name, subset_name, all_dataset_infos[dataset_name])
+    for dataset_name, subset_name in dataset_subsets
+}
+
+for dataset_name, subset_name in all_templates.keys:
     dataset = all_templates.get_dataset(dataset_name, subset_name)
-    num_templates = len(dataset.all_template_names)
+    template_names = dataset.all_template_names
+    num_templates = len(template_names)
     train_size = gsheet[(dataset_name, subset_name)]["train_size"]
     if train_size == "":
         train_size = 0
@@ -200,12 +290,19 @@ for dataset_name, subset_name in all_templates.keys:
         cap = MAX_EXAMPLES_PER_DATASET // num_templates
     else:
         cap = train_size
-    for template_name in dataset.all_template_names:
-        add_task(dataset_name, subset_name, template_name)
-
+    dataset_splits = all_dataset_splits[(dataset_name, subset_name)]
+    split_mapping = {k: k for k in dataset_splits.keys()}
+    num_input_examples = get_num_input_examples(dataset_splits, split_mapping)
+    for template_name in template_names:
         template = dataset[template_name]
-
-        task_name = utils.get_task_name(dataset_name, subset_name, template_name)
+        task_name = add_task(
+            dataset_name,
+            subset_name,
+            template_name,
+            split_mapping=split_mapping,
+            num_input_examples=num_input_examples,
+            template=template,
+        )
 
         if (dataset_name, subset_name) not in single_original_task and template.metadata.original_task:
             single_original_task[(dataset_name, subset_name)] = task_name
@@ -213,36 +310,46 @@ for dataset_name, subset_name in all_templates.keys:
         if template.metadata.original_task:
             all_original_tasks.append(task_name)
 
-        if (dataset_name, subset_name) in d4_train:
+        if (dataset_name, subset_name) in d4_train_set:
             d4_train_mixture.append(task_name)
             mixture_cap[task_name] = cap
-        if (dataset_name, subset_name) in d3_train_gpt:
+        if (dataset_name, subset_name) in d3_train_gpt_set:
             gpt_train_mixture.append(task_name)
             mixture_cap[task_name] = cap
-        if (dataset_name, subset_name) in d3_train_sglue:
+        if (dataset_name, subset_name) in d3_train_sglue_set:
             sglue_train_mixture.append(task_name)
             mixture_cap[task_name] = cap
-        if (dataset_name, subset_name) in d4_eval:
+        if (dataset_name, subset_name) in d4_eval_set:
             if template.metadata.original_task:
                 d4_eval_mixture.append(task_name)
             # TODO use template.metadata.answer_choices here for rank eval
-        if (dataset_name, subset_name) in bias_fairness_eval:
+        if (dataset_name, subset_name) in bias_fairness_eval_set:
             bias_fairness_eval_mixture.append(task_name)
 
 # Special case for ANLI, which has weirdly-named splits and rounds that should be subsets
 dataset_name, subset_name = ("anli", None)
 dataset = all_templates.get_dataset(dataset_name, subset_name)
+template_names = dataset.all_template_names
+dataset_splits = all_dataset_splits[(dataset_name, subset_name)]
 for anli_round in ("r1", "r2", "r3"):
-    for template_name in all_templates.get_dataset(dataset_name, subset_name).all_template_names:
-        task_name = utils.get_task_name(dataset_name, subset_name, template_name) + f"_{anli_round}"
-        split_mapping = {
-            "train": f"train_{anli_round}",
-            "validation": f"dev_{anli_round}",
-            "test": f"test_{anli_round}",
-        }
-        add_task(dataset_name, subset_name, template_name, task_name, split_mapping)
-
+    split_mapping = {
+        "train": f"train_{anli_round}",
+        "validation": f"dev_{anli_round}",
+        "test": f"test_{anli_round}",
+    }
+    num_input_examples = get_num_input_examples(dataset_splits, split_mapping)
+    for template_name in template_names:
         template = dataset[template_name]
+        task_name = utils.get_task_name(dataset_name, subset_name, template_name) + f"_{anli_round}"
+        add_task(
+            dataset_name,
+            subset_name,
+            template_name,
+            task_name,
+            split_mapping,
+            num_input_examples=num_input_examples,
+            template=template,
+        )
         if template.metadata.original_task:
             d4_eval_mixture.append(task_name)  # TODO or add to ANLI special mixture
         # TODO use template.metadata.answer_choices here for rank eval
@@ -298,124 +405,134 @@ D4_TRAIN_SCORE_EVAL_TASK_BLACKLIST = [
     "wiki_hop_original_choose_best_object_interrogative_2_score_eval",
 ]
 
+# Train tasks we don't care about evaluating on
+D4_TRAIN_SKIP_EVAL = [
+    "paws_labeled_final",
+    "adversarial_qa_dbidaf",
+    "adversarial_qa_dbert",
+    "duorc_ParaphraseRC",
+    "dream",
+    "amazon_polarity",
+    "app_reviews",
+    "imdb",
+    "wiki_bio",
+    "gigaword",
+    "multi_news",
+    "samsum",
+    "dbpedia_14",
+    "trec",
+]
+
+# Sets for constant-time membership checks when filtering the mixtures below
+_TASK_BLACKLIST = frozenset(TASK_BLACKLIST)
+_D4_TRAIN_SCORE_EVAL_TASK_BLACKLIST = frozenset(D4_TRAIN_SCORE_EVAL_TASK_BLACKLIST)
+d4_train_mixture_set = set(d4_train_mixture)
+d4_eval_mixture_set = set(d4_eval_mixture)
+bias_fairness_eval_mixture_set = set(bias_fairness_eval_mixture)
+all_original_tasks_set = set(all_original_tasks)
+
 seqio.MixtureRegistry.add(
     "d4_train",
-    [task for task in d4_train_mixture if task not in TASK_BLACKLIST],
+    [task for task in d4_train_mixture if task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "gpt_train",
-    [task for task in gpt_train_mixture if task not in TASK_BLACKLIST],
+    [task for task in gpt_train_mixture if task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "sglue_train",
-    [task for task in sglue_train_mixture if task not in TASK_BLACKLIST],
+    [task for task in sglue_train_mixture if task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "d4_gpt_train",
-    [task for task in d4_train_mixture + gpt_train_mixture if task not in TASK_BLACKLIST],
+    [task for task in d4_train_mixture + gpt_train_mixture if task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "d4_gpt_sglue_train",
-    [task for task in d4_train_mixture + gpt_train_mixture + sglue_train_mixture if task not in TASK_BLACKLIST],
+    [task for task in d4_train_mixture + gpt_train_mixture + sglue_train_mixture if task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "d4_eval",
-    [task for task in d4_eval_mixture if task not in TASK_BLACKLIST],
-    default_rate=functools.partial(seqio.mixing_rate_num_examples, maximum=500_000),
+    [task for task in d4_eval_mixture if task not in _TASK_BLACKLIST],
+    default_rate=_DEFAULT_RATE,
 )  # eval mixture does not need to be capped
 
 
+# Bucket the rank classification tasks into their mixtures with a single pass over the registry
+d4_score_eval_mixture: List[str] = []
+d4_train_score_eval_mixture: List[str] = []
+bias_fairness_eval_score_eval_mixture: List[str] = []
+for task in seqio.TaskRegistry.names():
+    if not task.endswith("_score_eval"):
+        continue
+    original_task_name = task.split("_score_eval")[0]
+    if original_task_name in d4_eval_mixture_set and original_task_name not in _TASK_BLACKLIST:
+        d4_score_eval_mixture.append(task)
+    if (
+        original_task_name in d4_train_mixture_set
+        and original_task_name not in _TASK_BLACKLIST
+        and task not in _D4_TRAIN_SCORE_EVAL_TASK_BLACKLIST
+        and not any([skip in task for skip in D4_TRAIN_SKIP_EVAL])
+        and original_task_name in all_original_tasks_set
+    ):
+        d4_train_score_eval_mixture.append(task)
+    if original_task_name in bias_fairness_eval_mixture_set:
+        bias_fairness_eval_score_eval_mixture.append(task)
+
 seqio.MixtureRegistry.add(
     "d4_score_eval",
-    [
-        task
-        for task in seqio.TaskRegistry.names()
-        if task.endswith("_score_eval")
-        and task.split("_score_eval")[0] in d4_eval_mixture
-        and task.split("_score_eval")[0] not in TASK_BLACKLIST
-    ],
-    default_rate=functools.partial(seqio.mixing_rate_num_examples, maximum=500_000),
+    d4_score_eval_mixture,
+    default_rate=_DEFAULT_RATE,
 )
 
-# Train tasks we don't care about evaluating on
-D4_TRAIN_SKIP_EVAL = [
-    "paws_labeled_final",
-    "adversarial_qa_dbidaf",
-    "adversarial_qa_dbert",
-    "duorc_ParaphraseRC",
-    "dream",
-    "amazon_polarity",
-    "app_reviews",
-    "imdb",
-    "wiki_bio",
-    "gigaword",
-    "multi_news",
-    "samsum",
-    "dbpedia_14",
-    "trec",
-]
-
 seqio.MixtureRegistry.add(
     "d4_train_eval",
     [
         task
         for task in d4_train_mixture
-        if task not in TASK_BLACKLIST
+        if task not in _TASK_BLACKLIST
         and not any([skip in task for skip in D4_TRAIN_SKIP_EVAL])
-        and task in all_original_tasks
+        and task in all_original_tasks_set
     ],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "d4_train_score_eval",
-    [
-        task
-        for task in seqio.TaskRegistry.names()
-        if task.endswith("_score_eval")
-        and task.split("_score_eval")[0] in d4_train_mixture
-        and task.split("_score_eval")[0] not in TASK_BLACKLIST
-        and task not in D4_TRAIN_SCORE_EVAL_TASK_BLACKLIST
-        and not any([skip in task for skip in D4_TRAIN_SKIP_EVAL])
-        and task.split("_score_eval")[0] in all_original_tasks
-    ],
-    default_rate=functools.partial(seqio.mixing_rate_num_examples, maximum=500_000),
+    d4_train_score_eval_mixture,
+    default_rate=_DEFAULT_RATE,
 )
 
 seqio.MixtureRegistry.add(
     "d4_train_one_og_prompt",
-    [task for task in single_original_task.values() if task in d4_train_mixture and task not in TASK_BLACKLIST],
+    [task for task in single_original_task.values() if task in d4_train_mixture_set and task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "d4_train_all_og_prompts",
-    [task for task in all_original_tasks if task in d4_train_mixture and task not in TASK_BLACKLIST],
+    [task for task in all_original_tasks if task in d4_train_mixture_set and task not in _TASK_BLACKLIST],
     default_rate=lambda t: mixture_cap[t.name],
 )
 
 seqio.MixtureRegistry.add(
     "bias_fairness_eval",
     bias_fairness_eval_mixture,
-    default_rate=functools.partial(seqio.mixing_rate_num_examples, maximum=500_000),
+    default_rate=_DEFAULT_RATE,
 )
 
 seqio.MixtureRegistry.add(
     "bias_fairness_eval_score_eval",
-    [
-        task
-        for task in seqio.TaskRegistry.names()
-        if task.endswith("_score_eval") and task.split("_score_eval")[0] in bias_fairness_eval_mixture
-    ],
-    default_rate=functools.partial(seqio.mixing_rate_num_examples, maximum=500_000),
+    bias_fairness_eval_score_eval_mixture,
+    default_rate=_DEFAULT_RATE,
 )
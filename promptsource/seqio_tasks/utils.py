@@ -1,3 +1,4 @@
+import functools
 import re
 
 import datasets
@@ -6,6 +7,10 @@ import tensorflow as tf
 import promptsource.utils
 
 
+# Characters not allowed in a seqio task name
+_TASK_CLEAN_RE = re.compile(r"[^\w\d\._]+")
+
+
 def feature_to_spec(feature, length=False):
     if isinstance(feature, datasets.ClassLabel):
         return tf.TensorSpec(shape=() if not length else (None if length == -1 else length,), dtype=tf.int64)
@@ -25,9 +30,17 @@ def feature_to_spec(feature, length=False):
         raise ValueError(f"Unparseable feature type {type(feature)}")
 
 
-def hf_dataset_to_tf_dataset(dataset):
+def hf_dataset_to_tf_dataset(dataset, batch_size=1000):
+    def generator():
+        # Reading slices of rows is much cheaper than fetching the examples from Arrow one at a time
+        for start in range(0, len(dataset), batch_size):
+            batch = dataset[start : start + batch_size]
+            columns = list(batch.keys())
+            for values in zip(*(batch[column] for column in columns)):
+                yield dict(zip(columns, values))
+
     return tf.data.Dataset.from_generator(
-        dataset.__iter__, output_signature={k: feature_to_spec(v) for k, v in dataset.features.items()}
+        generator, output_signature={k: feature_to_spec(v) for k, v in dataset.features.items()}
     )
 
 
@@ -53,25 +66,29 @@ def apply_template(dataset, template):
 
         return ex
 
-    def filter_fn(ex):
-        return len(ex["inputs"]) > 0 and len(ex["targets"]) > 0
+    def filter_fn(inputs, targets):
+        return [len(i) > 0 and len(t) > 0 for i, t in zip(inputs, targets)]
 
     original_columns = dataset.column_names
-    dataset = dataset.map(map_fn).filter(filter_fn)
+    # Filter on batches of the two relevant columns only, rather than formatting every column example by example
+    dataset = dataset.map(map_fn).filter(filter_fn, input_columns=["inputs", "targets"], batched=True)
     # map keeps original columns, remove them
     return dataset.remove_columns(set(original_columns) - {"inputs", "targets", "answer_choices"})
 
 
-def get_dataset_splits(dataset_name, subset_name=None):
-    info = datasets.get_dataset_infos(dataset_name)
+def get_dataset_splits(dataset_name, subset_name=None, info=None):
+    # info can be passed in when the dataset infos were already fetched for another subset
+    if info is None:
+        info = datasets.get_dataset_infos(dataset_name)
     subset_name = subset_name or list(info.keys())[0]
     return info[subset_name].splits
 
 
 def task_clean(text):
     # Clean the text according to allowed characters for a task name
-    return re.sub(r"[^\w\d\._]+", "_", text)
+    return _TASK_CLEAN_RE.sub("_", text)
 
 
+@functools.lru_cache(maxsize=None)
 def get_task_name(dataset_name, subset_name, template_name):
     return task_clean(dataset_name + (f"_{subset_name}_" if subset_name is not None else "_") + template_name)
@@ -1,3 +1,4 @@
+import functools
 import os
 import random
 import uuid
@@ -51,6 +52,18 @@ env.filters["choice"] = choice
 env.filters["most_frequent"] = most_frequent
 
 
+@functools.lru_cache(maxsize=4096)
+def compile_jinja(jinja):
+    """
+    Compiles a Jinja string with the promptsource environment.
+
+    Templates are rendered once per example, so the compiled result is cached
+    by source string instead of running the Jinja compiler on every call. The
+    cache is bounded since every edit of a template in the app is a new key.
+    """
+    return env.from_string(jinja)
+
+
 class Template(yaml.YAMLObject):
     """
     A prompt template.
@@ -129,7 +142,7 @@ class Template(yaml.YAMLObject):
         if jinja is None:
             return None
 
-        rtemplate = env.from_string(jinja)
+        rtemplate = compile_jinja(jinja)
         protected_example = self._escape_pipe(example)
         rendered_choices = rtemplate.render(**protected_example)
         return [self._unescape_pipe(answer_choice.strip()) for answer_choice in rendered_choices.split("|||")]
@@ -147,7 +160,8 @@ class Template(yaml.YAMLObject):
         parse = env.parse(jinja)
         variables = meta.find_undeclared_variables(parse)
         if len(variables) == 0:
-            rtemplate = env.from_string(jinja)
+            # Compiles the already parsed template instead of parsing it a second time
+            rtemplate = env.from_string(parse)
             rendered_choices = rtemplate.render()
             return [answer_choice.strip() for answer_choice in rendered_choices.split("|||")]
         else:
@@ -174,7 +188,7 @@ class Template(yaml.YAMLObject):
         # Highlights text that was substituted for variables, if requested
         if highlight_variables:
             jinja = jinja.replace("}}", " | highlight }}")
-        rtemplate = env.from_string(jinja)
+        rtemplate = compile_jinja(jinja)
 
         protected_example = self._escape_pipe(example)
 
@@ -299,7 +313,7 @@ class TemplateCollection:
         :param subset_name: name of the subset
         """
         # if the dataset does not exist, we add it
-        if dataset_name not in self.keys:
+        if (dataset_name, subset_name) not in self.datasets_templates:
             self.datasets_templates[(dataset_name, subset_name)] = DatasetTemplates(dataset_name, subset_name)
 
         return self.datasets_templates[(dataset_name, subset_name)]
@@ -335,17 +349,37 @@ class DatasetTemplates:
         self.dataset_name: str = dataset_name
         self.subset_name: str = subset_name
         # dictionary is keyed by template name.
-        self.templates: Dict = self.read_from_file()
+        # The yaml file is only read on first access, so unused datasets cost nothing to collect.
+        self._templates: Optional[Dict] = None
 
         # Mapping from template name to template id
-        self.name_to_id_mapping = {}
-        self.sync_mapping()
+        self._name_to_id_mapping: Dict = {}
+
+    @property
+    def templates(self) -> Dict:
+        """
+        Dictionary of all templates for this dataset, read from the yaml file on first access
+        """
+        if self._templates is None:
+            self._templates = self.read_from_file()
+            self.sync_mapping()
+        return self._templates
+
+    @property
+    def name_to_id_mapping(self) -> Dict:
+        """
+        Mapping from template name to template id
+        """
+        if self._templates is None:
+            # Reading the templates also syncs the mapping
+            self.templates
+        return self._name_to_id_mapping
 
     def sync_mapping(self) -> None:
         """
         Re-compute the name_to_id_mapping to ensure it is in sync with self.templates
         """
-        self.name_to_id_mapping = {template.name: template.id for template in self.templates.values()}
+        self._name_to_id_mapping = {template.name: template.id for template in self.templates.values()}
 
     @property
     def all_template_names(self) -> List[str]:
@@ -126,3 +126,34 @@ def test_dataset(dataset):
 
     # Turned off for now until we fix.
     #assert any_original, "There must be at least one original task template for each dataset"
+
+
+def test_get_dataset_is_cached():
+    """
+    Checks that TemplateCollection.get_dataset returns the same DatasetTemplates
+    object on every call instead of re-reading the yaml file.
+    """
+    collection = promptsource.templates.TemplateCollection()
+    dataset_name, subset_name = collection.keys[0]
+    assert collection.get_dataset(dataset_name, subset_name) is collection.get_dataset(dataset_name, subset_name)
+
+
+def test_templates_read_lazily():
+    """
+    Checks that a DatasetTemplates only reads its yaml file on first access, and
+    that templates and their name to id mapping are then populated.
+    """
+    collection = promptsource.templates.TemplateCollection()
+    (dataset_name, subset_name), (untouched_name, untouched_subset), mapping_first_key = collection.keys[:3]
+
+    dataset_templates = collection.get_dataset(dataset_name, subset_name)
+    assert dataset_templates._templates is None
+    assert len(dataset_templates) > 0
+    assert len(dataset_templates.all_template_names) == len(dataset_templates)
+    assert sorted(dataset_templates.name_to_id_mapping.keys()) == dataset_templates.all_template_names
+
+    # The mapping alone must also trigger the read, as used by DatasetTemplates.update_template
+    mapping_first_templates = collection.get_dataset(*mapping_first_key)
+    assert len(mapping_first_templates.name_to_id_mapping) == len(mapping_first_templates) > 0
+
+    assert collection.datasets_templates[untouched_name, untouched_subset]._templates is None